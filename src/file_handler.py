@@ -5,9 +5,20 @@ Handles all file operations for the Income Recording Client System
 
 import os
 import csv
+import logging
 import shutil
 from datetime import datetime
 
+from income_item import IncomeItem
+
+log = logging.getLogger(__name__)
+
+# Large buffer for bulk reads/writes; cuts syscall count on big files
+IO_BUFSIZE = 1 << 20
+
+# Maps filename characters that are invalid on common filesystems to '_'
+_INVALID_FILENAME_TRANS = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
 class FileHandler:
     def __init__(self):
         """Initialize file handler"""
@@ -21,9 +32,9 @@ class FileHandler:
             file_path (str): File path
         """
         directory = os.path.dirname(file_path)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory)
-            print(f"Created directory: {directory}")
+        if directory:
+            # Single syscall; no separate exists() check needed
+            os.makedirs(directory, exist_ok=True)
     
     def read_data_file(self, file_path):
         """
@@ -36,29 +47,92 @@ class FileHandler:
             list or None: List of lines if successful, None if error
         """
         try:
-            if not os.path.exists(file_path):
-                print(f"File not found: {file_path}")
-                return []
-            
-            with open(file_path, 'r', encoding=self.encoding) as file:
-                lines = file.readlines()
-            
-            # Remove newline characters and filter empty lines
-            lines = [line.strip() for line in lines if line.strip()]
-            
-            print(f"Successfully read {len(lines)} lines from {file_path}")
+            # Fast path for small files: one read syscall, no BufferedReader stack
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                size = os.fstat(fd).st_size
+                content = os.read(fd, size) if size < IO_BUFSIZE else None
+            finally:
+                os.close(fd)
+
+            if content is not None:
+                source = content.decode(self.encoding).splitlines()
+                # Strip each line once, skip empties
+                lines = [stripped for stripped in (line.strip() for line in source) if stripped]
+            else:
+                # Large file: stream through a buffered handle instead
+                with open(file_path, 'r', encoding=self.encoding, buffering=IO_BUFSIZE) as file:
+                    lines = [stripped for stripped in (line.strip() for line in file) if stripped]
+
+            log.debug("Read %d lines from %s", len(lines), file_path)
             return lines
-            
+
+        except FileNotFoundError:
+            log.warning("File not found: %s", file_path)
+            return []
         except IOError as e:
-            print(f"IO Error reading file {file_path}: {str(e)}")
+            log.error("IO Error reading file %s: %s", file_path, e)
             return None
         except UnicodeDecodeError as e:
-            print(f"Encoding error reading file {file_path}: {str(e)}")
+            log.error("Encoding error reading file %s: %s", file_path, e)
             return None
         except Exception as e:
-            print(f"Unexpected error reading file {file_path}: {str(e)}")
+            log.error("Unexpected error reading file %s: %s", file_path, e)
             return None
     
+    def iter_data_file(self, file_path):
+        """
+        Open a data file for streaming iteration
+
+        Returns a large-buffered text handle so callers can parse lines
+        as they are read instead of materializing the whole file first.
+        The caller is responsible for closing it (use a with block).
+
+        Args:
+            file_path (str): Path to data file
+
+        Returns:
+            file object: Open text-mode handle
+        """
+        return open(file_path, 'r', encoding=self.encoding, buffering=IO_BUFSIZE)
+
+    def bulk_read_income_items(self, file_path):
+        """
+        Read a whole data file and build IncomeItems in one pass
+
+        Reads the file with a single read, splits once and hands the
+        lines to IncomeItem.from_file_lines, so loading large files
+        avoids per-line read and validation overhead.
+
+        Args:
+            file_path (str): Path to data file
+
+        Returns:
+            list or None: IncomeItem objects if successful, None if error
+        """
+        try:
+            with open(file_path, 'rb') as file:
+                raw = file.read().decode(self.encoding)
+
+            lines = [line for line in raw.split('\n') if line.strip()]
+            items = IncomeItem.from_file_lines(lines, trusted=True)
+
+            log.debug("Read %d income items from %s", len(items), file_path)
+            return items
+
+        except FileNotFoundError:
+            log.warning("File not found: %s", file_path)
+            return []
+        except IOError as e:
+            log.error("IO Error reading file %s: %s", file_path, e)
+            return None
+        except (ValueError, UnicodeDecodeError) as e:
+            log.error("Error parsing file %s: %s", file_path, e)
+            return None
+        except Exception as e:
+            log.error("Unexpected error reading file %s: %s", file_path, e)
+            return None
+
     def write_data_file(self, file_path, data_lines):
         """
         Write data to pipe-delimited text file
@@ -74,20 +148,53 @@ class FileHandler:
             # Ensure directory exists
             self.ensure_directory_exists(file_path)
             
-            with open(file_path, 'w', encoding=self.encoding) as file:
-                for line in data_lines:
-                    file.write(line + '\n')
-            
-            print(f"Successfully wrote {len(data_lines)} lines to {file_path}")
+            with open(file_path, 'w', encoding=self.encoding, buffering=IO_BUFSIZE) as file:
+                # Single write call instead of one per line
+                if data_lines:
+                    file.write('\n'.join(data_lines) + '\n')
+
+            log.debug("Wrote %d lines to %s", len(data_lines), file_path)
             return True
             
         except IOError as e:
-            print(f"IO Error writing file {file_path}: {str(e)}")
+            log.error("IO Error writing file %s: %s", file_path, e)
             return False
         except Exception as e:
-            print(f"Unexpected error writing file {file_path}: {str(e)}")
+            log.error("Unexpected error writing file %s: %s", file_path, e)
             return False
     
+    def write_data_stream(self, file_path, lines):
+        """
+        Write data lines from an iterable without materializing a list
+
+        writelines() drains the generator straight into the buffered
+        handle, so serialization and I/O overlap and peak memory stays
+        constant.
+
+        Args:
+            file_path (str): Path to data file
+            lines (iterable): Data lines to write
+
+        Returns:
+            bool: True if successful, False if error
+        """
+        try:
+            # Ensure directory exists
+            self.ensure_directory_exists(file_path)
+
+            with open(file_path, 'w', encoding=self.encoding, buffering=IO_BUFSIZE) as file:
+                file.writelines(line + '\n' for line in lines)
+
+            log.debug("Wrote data stream to %s", file_path)
+            return True
+
+        except IOError as e:
+            log.error("IO Error writing file %s: %s", file_path, e)
+            return False
+        except Exception as e:
+            log.error("Unexpected error writing file %s: %s", file_path, e)
+            return False
+
     def read_csv_file(self, file_path):
         """
         Read CSV file
@@ -99,27 +206,24 @@ class FileHandler:
             list or None: List of rows if successful, None if error
         """
         try:
-            if not os.path.exists(file_path):
-                print(f"CSV file not found: {file_path}")
-                return None
-            
-            rows = []
-            with open(file_path, 'r', encoding=self.encoding, newline='') as file:
-                csv_reader = csv.reader(file)
-                for row in csv_reader:
-                    rows.append(row)
-            
-            print(f"Successfully read {len(rows)} rows from CSV: {file_path}")
+            with open(file_path, 'r', encoding=self.encoding, newline='', buffering=IO_BUFSIZE) as file:
+                # list() drains the reader in C, avoiding per-row Python dispatch
+                rows = list(csv.reader(file))
+
+            log.debug("Read %d rows from CSV: %s", len(rows), file_path)
             return rows
-            
+
+        except FileNotFoundError:
+            log.warning("CSV file not found: %s", file_path)
+            return None
         except IOError as e:
-            print(f"IO Error reading CSV file {file_path}: {str(e)}")
+            log.error("IO Error reading CSV file %s: %s", file_path, e)
             return None
         except csv.Error as e:
-            print(f"CSV Error reading file {file_path}: {str(e)}")
+            log.error("CSV Error reading file %s: %s", file_path, e)
             return None
         except Exception as e:
-            print(f"Unexpected error reading CSV file {file_path}: {str(e)}")
+            log.error("Unexpected error reading CSV file %s: %s", file_path, e)
             return None
     
     def write_csv_file(self, file_path, csv_lines):
@@ -137,20 +241,59 @@ class FileHandler:
             # Ensure directory exists
             self.ensure_directory_exists(file_path)
             
-            with open(file_path, 'w', encoding=self.encoding, newline='') as file:
-                for line in csv_lines:
-                    file.write(line + '\n')
-            
-            print(f"Successfully wrote {len(csv_lines)} lines to CSV: {file_path}")
+            with open(file_path, 'w', encoding=self.encoding, newline='', buffering=IO_BUFSIZE) as file:
+                # Single write call instead of one per line
+                if csv_lines:
+                    file.write('\n'.join(csv_lines) + '\n')
+
+            log.debug("Wrote %d lines to CSV: %s", len(csv_lines), file_path)
             return True
             
         except IOError as e:
-            print(f"IO Error writing CSV file {file_path}: {str(e)}")
+            log.error("IO Error writing CSV file %s: %s", file_path, e)
             return False
         except Exception as e:
-            print(f"Unexpected error writing CSV file {file_path}: {str(e)}")
+            log.error("Unexpected error writing CSV file %s: %s", file_path, e)
             return False
     
+    def write_csv_stream(self, file_path, lines, header=None):
+        """
+        Write CSV lines from an iterable without materializing a list
+
+        Rows are written as they are produced, so peak memory stays
+        constant regardless of how many records the caller exports.
+
+        Args:
+            file_path (str): Path to CSV file
+            lines (iterable): CSV lines to write
+            header (str): Optional header line written first
+
+        Returns:
+            int or None: Number of data lines written, None if error
+        """
+        try:
+            # Ensure directory exists
+            self.ensure_directory_exists(file_path)
+
+            written = 0
+            with open(file_path, 'w', encoding=self.encoding, newline='', buffering=IO_BUFSIZE) as file:
+                if header is not None:
+                    file.write(header + '\n')
+                for line in lines:
+                    file.write(line)
+                    file.write('\n')
+                    written += 1
+
+            log.debug("Wrote %d lines to CSV: %s", written, file_path)
+            return written
+
+        except IOError as e:
+            log.error("IO Error writing CSV file %s: %s", file_path, e)
+            return None
+        except Exception as e:
+            log.error("Unexpected error writing CSV file %s: %s", file_path, e)
+            return None
+
     def write_csv_with_writer(self, file_path, rows, headers=None):
         """
         Write CSV file using csv.writer
@@ -167,61 +310,96 @@ class FileHandler:
             # Ensure directory exists
             self.ensure_directory_exists(file_path)
             
-            with open(file_path, 'w', encoding=self.encoding, newline='') as file:
+            with open(file_path, 'w', encoding=self.encoding, newline='', buffering=IO_BUFSIZE) as file:
                 csv_writer = csv.writer(file)
                 
                 # Write headers if provided
                 if headers:
                     csv_writer.writerow(headers)
                 
-                # Write data rows
-                for row in rows:
-                    csv_writer.writerow(row)
+                # Write data rows in one C-level call
+                csv_writer.writerows(rows)
             
             total_rows = len(rows) + (1 if headers else 0)
-            print(f"Successfully wrote {total_rows} rows to CSV: {file_path}")
+            log.debug("Wrote %d rows to CSV: %s", total_rows, file_path)
             return True
             
         except IOError as e:
-            print(f"IO Error writing CSV file {file_path}: {str(e)}")
+            log.error("IO Error writing CSV file %s: %s", file_path, e)
             return False
         except csv.Error as e:
-            print(f"CSV Error writing file {file_path}: {str(e)}")
+            log.error("CSV Error writing file %s: %s", file_path, e)
             return False
         except Exception as e:
-            print(f"Unexpected error writing CSV file {file_path}: {str(e)}")
+            log.error("Unexpected error writing CSV file %s: %s", file_path, e)
             return False
     
-    def copy_file(self, source_path, destination_path):
+    def copy_file(self, source_path, destination_path, preserve_metadata=True):
         """
         Copy file from source to destination
-        
+
         Args:
             source_path (str): Source file path
             destination_path (str): Destination file path
-            
+            preserve_metadata (bool): Copy timestamps/permissions too;
+                pass False for a data-only copy that uses the kernel
+                fast path (copy_file_range/sendfile) on Linux
+
         Returns:
             bool: True if successful, False if error
         """
         try:
-            if not os.path.exists(source_path):
-                print(f"Source file not found: {source_path}")
-                return False
-            
             # Ensure destination directory exists
             self.ensure_directory_exists(destination_path)
-            
-            shutil.copy2(source_path, destination_path)
-            print(f"Successfully copied {source_path} to {destination_path}")
+
+            if preserve_metadata:
+                shutil.copy2(source_path, destination_path)
+            else:
+                shutil.copyfile(source_path, destination_path)
+            log.debug("Copied %s to %s", source_path, destination_path)
             return True
-            
+
+        except FileNotFoundError:
+            log.warning("Source file not found: %s", source_path)
+            return False
         except IOError as e:
-            print(f"IO Error copying file: {str(e)}")
+            log.error("IO Error copying file: %s", e)
             return False
         except Exception as e:
-            print(f"Unexpected error copying file: {str(e)}")
+            log.error("Unexpected error copying file: %s", e)
             return False
     
+    def bulk_copy(self, pairs, preserve_metadata=False):
+        """
+        Copy many files in one batched call
+
+        Intended for backup/snapshot workflows that copy hundreds of
+        files: the default data-only mode uses the kernel copy fast
+        path per file and skips per-file metadata syscalls.
+
+        Args:
+            pairs (list): (source_path, destination_path) tuples
+            preserve_metadata (bool): Copy timestamps/permissions too
+
+        Returns:
+            int: Number of files copied successfully
+        """
+        copy_func = shutil.copy2 if preserve_metadata else shutil.copyfile
+        copied = 0
+
+        for source_path, destination_path in pairs:
+            try:
+                self.ensure_directory_exists(destination_path)
+                copy_func(source_path, destination_path)
+                copied += 1
+            except FileNotFoundError:
+                log.warning("Source file not found: %s", source_path)
+            except (IOError, OSError) as e:
+                log.error("Error copying %s: %s", source_path, e)
+
+        log.debug("Copied %d of %d files", copied, len(pairs))
+        return copied
+
     def delete_file(self, file_path):
         """
         Delete file
@@ -233,19 +411,18 @@ class FileHandler:
             bool: True if successful, False if error
         """
         try:
-            if not os.path.exists(file_path):
-                print(f"File not found: {file_path}")
-                return True  # Consider it successful if file doesn't exist
-            
             os.remove(file_path)
-            print(f"Successfully deleted file: {file_path}")
+            log.debug("Deleted file: %s", file_path)
             return True
-            
+
+        except FileNotFoundError:
+            log.debug("File not found: %s", file_path)
+            return True  # Consider it successful if file doesn't exist
         except IOError as e:
-            print(f"IO Error deleting file {file_path}: {str(e)}")
+            log.error("IO Error deleting file %s: %s", file_path, e)
             return False
         except Exception as e:
-            print(f"Unexpected error deleting file {file_path}: {str(e)}")
+            log.error("Unexpected error deleting file %s: %s", file_path, e)
             return False
     
     def file_exists(self, file_path):
@@ -260,46 +437,52 @@ class FileHandler:
         """
         return os.path.exists(file_path)
     
-    def get_file_size(self, file_path):
+    def stat_file(self, file_path):
         """
-        Get file size in bytes
-        
+        Get file size and modification time with a single stat call
+
         Args:
             file_path (str): File path
-            
+
         Returns:
-            int or None: File size in bytes if successful, None if error
+            tuple or None: (size, modification datetime) if successful,
+                None if error
         """
         try:
-            if not os.path.exists(file_path):
-                return None
-            
-            return os.path.getsize(file_path)
-            
+            stat_result = os.stat(file_path)
+            return stat_result.st_size, datetime.fromtimestamp(stat_result.st_mtime)
+
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            print(f"Error getting file size for {file_path}: {str(e)}")
+            log.error("Error getting file stats for %s: %s", file_path, e)
             return None
-    
+
+    def get_file_size(self, file_path):
+        """
+        Get file size in bytes
+
+        Args:
+            file_path (str): File path
+
+        Returns:
+            int or None: File size in bytes if successful, None if error
+        """
+        stats = self.stat_file(file_path)
+        return stats[0] if stats else None
+
     def get_file_modification_time(self, file_path):
         """
         Get file modification time
-        
+
         Args:
             file_path (str): File path
-            
+
         Returns:
             datetime or None: Modification time if successful, None if error
         """
-        try:
-            if not os.path.exists(file_path):
-                return None
-            
-            timestamp = os.path.getmtime(file_path)
-            return datetime.fromtimestamp(timestamp)
-            
-        except Exception as e:
-            print(f"Error getting modification time for {file_path}: {str(e)}")
-            return None
+        stats = self.stat_file(file_path)
+        return stats[1] if stats else None
     
     def create_backup(self, file_path, backup_suffix="_backup"):
         """
@@ -313,10 +496,6 @@ class FileHandler:
             str or None: Backup file path if successful, None if error
         """
         try:
-            if not os.path.exists(file_path):
-                print(f"Original file not found: {file_path}")
-                return None
-            
             # Generate backup file path
             name, ext = os.path.splitext(file_path)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -329,7 +508,7 @@ class FileHandler:
                 return None
                 
         except Exception as e:
-            print(f"Error creating backup for {file_path}: {str(e)}")
+            log.error("Error creating backup for %s: %s", file_path, e)
             return None
     
     def validate_file_format(self, file_path, expected_extension):
@@ -360,15 +539,9 @@ class FileHandler:
             str: Safe filename
         """
         try:
-            # Remove or replace invalid characters
-            invalid_chars = '<>:"/\\|?*'
-            safe_filename = filename
-            
-            for char in invalid_chars:
-                safe_filename = safe_filename.replace(char, '_')
-            
-            # Remove leading/trailing spaces and dots
-            safe_filename = safe_filename.strip(' .')
+            # Replace invalid characters in a single translate pass,
+            # then remove leading/trailing spaces and dots
+            safe_filename = filename.translate(_INVALID_FILENAME_TRANS).strip(' .')
             
             # Ensure filename is not empty
             if not safe_filename:
@@ -7,6 +7,21 @@ import re
 from datetime import datetime
 
 class IncomeItem:
+    # Fixed attribute layout: smaller instances and faster attribute access
+    # when holding many records in memory
+    __slots__ = ('code', 'description', 'date', 'income_amount', 'wht_amount',
+                 '_csv_cache', '_file_cache')
+
+    # Compiled once at class creation; avoids re-cache lookups per validation
+    _CODE_PATTERN = re.compile(r'^[A-Z]{2}\d{3}$')
+
+    # Bytes counted by the checksum: capitals, digits and decimal points
+    _CHECKSUM_BYTES = b'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.'
+
+    # Precompiled %-templates: cheaper than re-parsing f-string specs per row
+    _FILE_FMT = '%s|%s|%s|%.2f|%.2f'
+    _CSV_FMT = '%s,%s,%s,%.2f,%.2f'
+
     def __init__(self, code, description, date, income_amount, wht_amount):
         """
         Initialize an income item with validation
@@ -23,7 +38,9 @@ class IncomeItem:
         self.date = self.validate_and_set_date(date)
         self.income_amount = self.validate_and_set_income_amount(income_amount)
         self.wht_amount = self.validate_and_set_wht_amount(wht_amount)
-    
+        self._csv_cache = None
+        self._file_cache = None
+
     def validate_and_set_code(self, code):
         """Validate and set income code"""
         if not isinstance(code, str):
@@ -32,8 +49,7 @@ class IncomeItem:
         code = code.strip().upper()
         
         # Check format: 2 letters + 3 digits
-        pattern = r'^[A-Z]{2}\d{3}$'
-        if not re.match(pattern, code):
+        if not self._CODE_PATTERN.match(code):
             raise ValueError("Income code must be 2 letters followed by 3 digits (e.g., IN001)")
         
         return code
@@ -60,15 +76,14 @@ class IncomeItem:
         
         date = date.strip()
         
-        # Check format DD/MM/YYYY
-        pattern = r'^\d{2}/\d{2}/\d{4}$'
-        if not re.match(pattern, date):
+        # Check fixed DD/MM/YYYY shape with slice tests; no regex engine needed
+        if (len(date) != 10 or date[2] != '/' or date[5] != '/'
+                or not (date[:2].isdigit() and date[3:5].isdigit() and date[6:].isdigit())):
             raise ValueError("Date must be in DD/MM/YYYY format")
-        
+
         # Validate actual date
         try:
-            day, month, year = map(int, date.split('/'))
-            datetime(year, month, day)
+            datetime(int(date[6:]), int(date[3:5]), int(date[:2]))
         except ValueError:
             raise ValueError("Invalid date values")
         
@@ -115,14 +130,20 @@ class IncomeItem:
     
     def to_csv_line(self):
         """Convert to CSV line format with checksum"""
+        # Reuse the cached line for read-mostly re-exports
+        if self._csv_cache is not None:
+            return self._csv_cache
+
         # Create CSV line without checksum first
-        csv_line = f"{self.code},{self.description},{self.date},{self.income_amount:.2f},{self.wht_amount:.2f}"
-        
+        csv_line = self._CSV_FMT % (self.code, self.description, self.date,
+                                    self.income_amount, self.wht_amount)
+
         # Calculate checksum
         checksum = self.calculate_checksum(csv_line)
-        
-        # Return complete CSV line with checksum
-        return f"{csv_line},{checksum}"
+
+        # Cache complete CSV line with checksum
+        self._csv_cache = f"{csv_line},{checksum}"
+        return self._csv_cache
     
     def calculate_checksum(self, line):
         """
@@ -139,14 +160,47 @@ class IncomeItem:
         Returns:
             int: Checksum value
         """
-        capital_count = sum(1 for char in line if char.isupper())
-        number_decimal_count = sum(1 for char in line if char.isdigit() or char == '.')
-        
+        # Single pass: a character is either a capital or a digit/decimal, never both
+        capital_count = 0
+        number_decimal_count = 0
+        for char in line:
+            if char.isupper():
+                capital_count += 1
+            elif char.isdigit() or char == '.':
+                number_decimal_count += 1
+
         return capital_count + number_decimal_count
     
+    @staticmethod
+    def calculate_checksums(lines):
+        """
+        Calculate checksums for many lines at once
+
+        Counts the same characters as calculate_checksum (capitals,
+        digits and decimal points) but classifies bytes with
+        bytes.translate, so the per-character loop runs in C instead
+        of Python. Use this when exporting many records in one batch.
+
+        Args:
+            lines (list): Transaction lines to checksum
+
+        Returns:
+            list: Checksum value for each line
+        """
+        counted = IncomeItem._CHECKSUM_BYTES
+        checksums = []
+        for line in lines:
+            encoded = line.encode('ascii', 'ignore')
+            checksums.append(len(encoded) - len(encoded.translate(None, counted)))
+        return checksums
+
     def to_file_line(self):
         """Convert to file storage format (pipe-delimited)"""
-        return f"{self.code}|{self.description}|{self.date}|{self.income_amount:.2f}|{self.wht_amount:.2f}"
+        # Reuse the cached line so repeated saves only serialize changes
+        if self._file_cache is None:
+            self._file_cache = self._FILE_FMT % (self.code, self.description, self.date,
+                                                 self.income_amount, self.wht_amount)
+        return self._file_cache
     
     @classmethod
     def from_file_line(cls, line):
@@ -165,6 +219,81 @@ class IncomeItem:
         except (ValueError, IndexError) as e:
             raise ValueError(f"Error parsing file line: {str(e)}")
     
+    @classmethod
+    def _from_trusted_fields(cls, code, description, date, income_amount, wht_amount):
+        """
+        Build an item from pre-validated fields, skipping __init__
+
+        Fast constructor for the trusted bulk-load paths: no isinstance
+        checks, no regex match and no rounding — the fields must come
+        from our own serialized output.
+        """
+        item = object.__new__(cls)
+        item.code = code
+        item.description = description
+        item.date = date
+        item.income_amount = income_amount
+        item.wht_amount = wht_amount
+        item._csv_cache = None
+        item._file_cache = None
+        return item
+
+    @classmethod
+    def from_file_lines(cls, lines, trusted=True):
+        """
+        Create many IncomeItems from file lines in one pass
+
+        When trusted is True the lines are assumed to come from
+        to_file_line output, so field validation is skipped and items
+        are built by direct attribute assignment. Pass trusted=False
+        for data from unknown sources to go through the validating
+        constructor.
+
+        Args:
+            lines (list): Pipe-delimited file lines
+            trusted (bool): Skip validation for our own file format
+
+        Returns:
+            list: IncomeItem objects
+        """
+        if not trusted:
+            return [cls.from_file_line(line) for line in lines]
+
+        items = []
+        for line in lines:
+            parts = line.strip().split('|', 4)
+            if len(parts) != 5:
+                raise ValueError("Invalid file line format")
+
+            items.append(cls._from_trusted_fields(
+                parts[0], parts[1], parts[2], float(parts[3]), float(parts[4])))
+
+        return items
+
+    @classmethod
+    def from_file_bytes(cls, data):
+        """
+        Create IncomeItem from a pipe-delimited bytes line
+
+        Tokenizes at the bytes level so callers reading files in binary
+        mode only decode the text fields instead of the whole line;
+        float() accepts the numeric fields as bytes directly. Fields
+        are trusted, matching from_file_lines(trusted=True).
+
+        Args:
+            data (bytes or memoryview): Pipe-delimited line
+
+        Returns:
+            IncomeItem: Parsed item
+        """
+        parts = bytes(data).strip().split(b'|', 4)
+        if len(parts) != 5:
+            raise ValueError("Invalid file line format")
+
+        return cls._from_trusted_fields(
+            parts[0].decode('ascii'), parts[1].decode('utf-8'),
+            parts[2].decode('ascii'), float(parts[3]), float(parts[4]))
+
     @classmethod
     def from_csv_line(cls, line):
         """Create IncomeItem from CSV line (with or without checksum)"""
@@ -197,7 +326,11 @@ class IncomeItem:
         
         if wht_amount is not None:
             self.wht_amount = self.validate_and_set_wht_amount(wht_amount)
-    
+
+        # Fields changed; drop the cached export lines
+        self._csv_cache = None
+        self._file_cache = None
+
     def __str__(self):
         """String representation"""
         return (f"IncomeItem(code={self.code}, description={self.description}, "
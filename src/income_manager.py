@@ -3,31 +3,82 @@ Income Manager Class
 Core business logic for Income Recording Client System
 """
 
+import functools
 import re
 import os
 from datetime import datetime
 from income_item import IncomeItem
 from file_handler import FileHandler
 
+# Compiled once at import; avoids re-cache lookups on every validation
+_CODE_RE = re.compile(r'^[A-Z]{2}\d{3}$')
+
+@functools.lru_cache(maxsize=1024)
+def _is_valid_date(date_str):
+    """
+    Check a stripped DD/MM/YYYY date string
+
+    Memoized: bulk loads and validation loops often re-check the same
+    handful of dates, so repeats cost one dict lookup.
+    """
+    # Check fixed DD/MM/YYYY shape with slice tests; no regex needed
+    if len(date_str) != 10 or date_str[2] != '/' or date_str[5] != '/':
+        return False
+
+    day_s, month_s, year_s = date_str[:2], date_str[3:5], date_str[6:]
+    if not (day_s.isdigit() and month_s.isdigit() and year_s.isdigit()):
+        return False
+
+    day, month, year = int(day_s), int(month_s), int(year_s)
+
+    # Days 1-28 are valid in every month; no datetime needed
+    if 1 <= day <= 28 and 1 <= month <= 12 and year >= 1:
+        return True
+
+    # Month-length and leap-year edge cases
+    try:
+        datetime(year, month, day)
+        return True
+    except ValueError:
+        return False
+
 class IncomeManager:
-    def __init__(self):
-        """Initialize income manager"""
+    # Absolute paths already created this process; avoids repeating the
+    # mkdir syscalls for every manager instance
+    _ensured_dirs = set()
+
+    def __init__(self, base_dir=None):
+        """
+        Initialize income manager
+
+        Args:
+            base_dir (str): Directory holding the data/output folders;
+                defaults to the current working directory
+        """
         self.income_items = {}  # Dictionary to store income items by code
         self.file_handler = FileHandler()
-        self.data_file = "data/income_data.txt"
-        self.csv_file = "output/income_sheet.csv"
-        
+        self.base_dir = base_dir or ''
+        self.data_file = os.path.join(self.base_dir, 'data', 'income_data.txt')
+        self.csv_file = os.path.join(self.base_dir, 'output', 'income_sheet.csv')
+        self.dirty = False  # True when items changed since the last save
+
         # Ensure directories exist
         self.ensure_directories()
-    
+
     def ensure_directories(self):
         """Ensure required directories exist"""
-        directories = ['data', 'output']
-        for directory in directories:
-            if not os.path.exists(directory):
-                os.makedirs(directory)
-                print(f"Created directory: {directory}")
+        for directory in ('data', 'output'):
+            path = os.path.abspath(os.path.join(self.base_dir, directory))
+            if path not in self._ensured_dirs:
+                os.makedirs(path, exist_ok=True)
+                self._ensured_dirs.add(path)
     
+    @staticmethod
+    def _norm(code):
+        """Normalize a code for dictionary lookup without copying when
+        the caller already passed uppercase ASCII (the common case)"""
+        return code if code.isascii() and code.isupper() else code.upper()
+
     def validate_income_code(self, code):
         """
         Validate income code format
@@ -42,8 +93,7 @@ class IncomeManager:
             return False
         
         code = code.strip().upper()
-        pattern = r'^[A-Z]{2}\d{3}$'
-        return bool(re.match(pattern, code))
+        return bool(_CODE_RE.match(code))
     
     def validate_date(self, date_str):
         """
@@ -58,20 +108,7 @@ class IncomeManager:
         if not isinstance(date_str, str):
             return False
         
-        date_str = date_str.strip()
-        
-        # Check format DD/MM/YYYY
-        pattern = r'^\d{2}/\d{2}/\d{4}$'
-        if not re.match(pattern, date_str):
-            return False
-        
-        # Validate actual date
-        try:
-            day, month, year = map(int, date_str.split('/'))
-            datetime(year, month, day)
-            return True
-        except ValueError:
-            return False
+        return _is_valid_date(date_str.strip())
     
     def code_exists(self, code):
         """
@@ -83,7 +120,7 @@ class IncomeManager:
         Returns:
             bool: True if exists, False otherwise
         """
-        return code.upper() in self.income_items
+        return self._norm(code) in self.income_items
     
     def add_income(self, code, description, date, income_amount, wht_amount):
         """
@@ -102,15 +139,15 @@ class IncomeManager:
         try:
             # Create new income item (validation happens in constructor)
             income_item = IncomeItem(code, description, date, income_amount, wht_amount)
-            
-            # Check for duplicate codes
-            if self.code_exists(income_item.code):
+
+            # Insert unless the code is already taken (single dict lookup)
+            existing = self.income_items.setdefault(income_item.code, income_item)
+            if existing is not income_item:
                 print(f"Error: Income code {income_item.code} already exists!")
                 return False
-            
-            # Add to collection
-            self.income_items[income_item.code] = income_item
-            
+
+            self.dirty = True
+
             print(f"Income item {income_item.code} added successfully.")
             return True
             
@@ -132,10 +169,11 @@ class IncomeManager:
             bool: True if successful, False otherwise
         """
         try:
-            code = code.upper()
-            
+            code = self._norm(code)
+
             if code in self.income_items:
                 del self.income_items[code]
+                self.dirty = True
                 print(f"Income item {code} deleted successfully.")
                 return True
             else:
@@ -161,15 +199,16 @@ class IncomeManager:
             bool: True if successful, False otherwise
         """
         try:
-            code = code.upper()
-            
+            code = self._norm(code)
+
             if code not in self.income_items:
                 print(f"Income item {code} not found.")
                 return False
             
             # Update the existing item
             self.income_items[code].update(description, date, income_amount, wht_amount)
-            
+            self.dirty = True
+
             print(f"Income item {code} updated successfully.")
             return True
             
@@ -191,12 +230,8 @@ class IncomeManager:
             dict or None: Income item data if found, None otherwise
         """
         try:
-            code = code.upper()
-            
-            if code in self.income_items:
-                return self.income_items[code].to_dict()
-            else:
-                return None
+            item = self.income_items.get(self._norm(code))
+            return item.to_dict() if item else None
                 
         except Exception as e:
             print(f"Error searching income item: {str(e)}")
@@ -215,6 +250,23 @@ class IncomeManager:
             print(f"Error getting all items: {str(e)}")
             return []
     
+    # Header line for the generated income sheet
+    CSV_HEADER = "Income_Code,Description,Date,Income_Amount,WHT_Amount,Checksum"
+
+    def render_csv(self):
+        """
+        Render the income sheet CSV as a string
+
+        In-memory counterpart of generate_income_sheet for callers
+        (and tests) that do not need the disk round-trip.
+
+        Returns:
+            str: CSV content including header and trailing newline
+        """
+        lines = [self.CSV_HEADER]
+        lines.extend(item.to_csv_line() for item in self.income_items.values())
+        return '\n'.join(lines) + '\n'
+
     def generate_income_sheet(self):
         """
         Generate CSV income sheet with checksums
@@ -227,19 +279,15 @@ class IncomeManager:
                 print("No income items to export!")
                 return False
             
-            # Prepare CSV content
-            csv_lines = []
-            csv_lines.append("Income_Code,Description,Date,Income_Amount,WHT_Amount,Checksum")
-            
-            for item in self.income_items.values():
-                csv_lines.append(item.to_csv_line())
-            
-            # Write to file
-            success = self.file_handler.write_csv_file(self.csv_file, csv_lines)
-            
-            if success:
+            # Stream rows straight to disk instead of building a list
+            rows = (item.to_csv_line() for item in self.income_items.values())
+
+            written = self.file_handler.write_csv_stream(self.csv_file, rows,
+                                                         header=self.CSV_HEADER)
+
+            if written is not None:
                 print(f"Income sheet generated successfully: {self.csv_file}")
-                print(f"Total records exported: {len(self.income_items)}")
+                print(f"Total records exported: {written}")
                 return True
             else:
                 print("Failed to generate income sheet!")
@@ -260,7 +308,26 @@ class IncomeManager:
     def calculate_total_net(self):
         """Calculate total net amount"""
         return sum(item.get_net_amount() for item in self.income_items.values())
-    
+
+    def _totals(self):
+        """
+        Accumulate income, WHT and net totals in a single pass
+
+        One scan over the items instead of three; the aggregation is
+        the hot spot once the table holds thousands of records.
+
+        Returns:
+            tuple: (total_income, total_wht, total_net)
+        """
+        total_income = 0.0
+        total_wht = 0.0
+        total_net = 0.0
+        for item in self.income_items.values():
+            total_income += item.income_amount
+            total_wht += item.wht_amount
+            total_net += item.get_net_amount()
+        return total_income, total_wht, total_net
+
     def get_statistics(self):
         """
         Get income statistics
@@ -270,9 +337,7 @@ class IncomeManager:
         """
         try:
             total_items = len(self.income_items)
-            total_income = self.calculate_total_income()
-            total_wht = self.calculate_total_wht()
-            total_net = self.calculate_total_net()
+            total_income, total_wht, total_net = self._totals()
             
             return {
                 'total_items': total_items,
@@ -298,24 +363,24 @@ class IncomeManager:
                 print("No existing data file found. Starting with empty data.")
                 return True
             
-            lines = self.file_handler.read_data_file(self.data_file)
-            
-            if lines is None:
-                print("Error reading data file!")
-                return False
-            
             loaded_count = 0
             error_count = 0
-            
-            for line_num, line in enumerate(lines, 1):
-                try:
-                    if line.strip():  # Skip empty lines
-                        item = IncomeItem.from_file_line(line)
-                        self.income_items[item.code] = item
+
+            # Iterate the handle directly so parsing overlaps with I/O;
+            # pre-bind the hot lookups so the loop body is LOAD_FAST only
+            parse_line = IncomeItem.from_file_line
+            put_item = self.income_items.__setitem__
+            with self.file_handler.iter_data_file(self.data_file) as file:
+                for line_num, line in enumerate(file, 1):
+                    if line == '\n' or line.isspace():  # Skip empty lines
+                        continue
+                    try:
+                        item = parse_line(line)
+                        put_item(item.code, item)
                         loaded_count += 1
-                except Exception as e:
-                    print(f"Error loading line {line_num}: {str(e)}")
-                    error_count += 1
+                    except Exception as e:
+                        print(f"Error loading line {line_num}: {str(e)}")
+                        error_count += 1
             
             print(f"Data loaded successfully: {loaded_count} items loaded")
             if error_count > 0:
@@ -327,6 +392,22 @@ class IncomeManager:
             print(f"Error loading data: {str(e)}")
             return False
     
+    def _write_items(self, path):
+        """
+        Serialize all items to a file with one streaming write
+
+        Shared by save_data and backup_data; serialization feeds the
+        file handle directly instead of building a list of lines.
+
+        Args:
+            path (str): Destination file path
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        lines = (item.to_file_line() for item in self.income_items.values())
+        return self.file_handler.write_data_stream(path, lines)
+
     def save_data(self):
         """
         Save income data to file
@@ -335,15 +416,10 @@ class IncomeManager:
             bool: True if successful, False otherwise
         """
         try:
-            # Prepare data lines
-            data_lines = []
-            for item in self.income_items.values():
-                data_lines.append(item.to_file_line())
-            
-            # Write to file
-            success = self.file_handler.write_data_file(self.data_file, data_lines)
-            
+            success = self._write_items(self.data_file)
+
             if success:
+                self.dirty = False
                 print(f"Data saved successfully: {len(self.income_items)} items saved")
                 return True
             else:
@@ -367,16 +443,11 @@ class IncomeManager:
         try:
             if backup_file is None:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                backup_file = f"data/backup_income_data_{timestamp}.txt"
-            
-            # Prepare data lines
-            data_lines = []
-            for item in self.income_items.values():
-                data_lines.append(item.to_file_line())
-            
-            # Write backup
-            success = self.file_handler.write_data_file(backup_file, data_lines)
-            
+                backup_file = os.path.join(self.base_dir, 'data',
+                                           f"backup_income_data_{timestamp}.txt")
+
+            success = self._write_items(backup_file)
+
             if success:
                 print(f"Backup created successfully: {backup_file}")
                 return True
@@ -392,6 +463,7 @@ class IncomeManager:
         """Clear all income data"""
         try:
             self.income_items.clear()
+            self.dirty = True
             print("All income data cleared.")
             return True
         except Exception as e:
@@ -9,9 +9,25 @@ from income_manager import IncomeManager
 
 
 class IRCSApplication:
+    # Flush at most every N data-changing operations instead of after
+    # each one; data is always saved on exit
+    SAVE_INTERVAL = 16
+
     def __init__(self):
         self.manager = IncomeManager()
         self.running = True
+        self.ops_since_save = 0
+
+        # Constant-time menu dispatch bound once instead of an elif chain
+        self._handlers = {
+            '1': self.handle_add_income,
+            '2': self.handle_delete_income,
+            '3': self.handle_update_income,
+            '4': self.handle_search_income,
+            '5': self.handle_generate_sheet,
+            '6': self.handle_view_all,
+        }
+        self._valid_choices = frozenset('0123456')
     
     def display_menu(self):
         """Display the main menu options"""
@@ -31,7 +47,7 @@ class IRCSApplication:
         """Get and validate user menu choice"""
         try:
             choice = input("Enter your choice (0-6): ").strip()
-            if choice in ['0', '1', '2', '3', '4', '5', '6']:
+            if choice in self._valid_choices:
                 return choice
             else:
                 print("Invalid choice! Please enter a number between 0-6.")
@@ -40,59 +56,84 @@ class IRCSApplication:
             print("\nExiting application...")
             return '0'
     
+    def prompt_validated(self, prompt, check):
+        """
+        Prompt repeatedly until check accepts the input
+
+        Args:
+            prompt (str): Prompt shown to the user
+            check (callable): Takes the stripped input and returns the
+                converted value, raising ValueError with a message when
+                the input is invalid
+
+        Returns:
+            The converted value
+        """
+        while True:
+            try:
+                return check(input(prompt).strip())
+            except ValueError as e:
+                print(f"Error: {str(e)}")
+
+    def _check_new_code(self, value):
+        """Validate a code for a new income item"""
+        code = value.upper()
+        if not self.manager.validate_income_code(code):
+            raise ValueError("Invalid code format! Use 2 letters + 3 digits.")
+        if self.manager.code_exists(code):
+            raise ValueError("Income code already exists!")
+        return code
+
+    @staticmethod
+    def _check_description(value):
+        """Validate a description"""
+        if 1 <= len(value) <= 20:
+            return value
+        raise ValueError("Description must be 1-20 characters long!")
+
+    def _check_date(self, value):
+        """Validate a date"""
+        if self.manager.validate_date(value):
+            return value
+        raise ValueError("Invalid date format! Use DD/MM/YYYY.")
+
+    @staticmethod
+    def _check_income_amount(value):
+        """Validate an income amount"""
+        try:
+            amount = float(value)
+        except ValueError:
+            raise ValueError("Please enter a valid number!")
+        if amount <= 0:
+            raise ValueError("Income amount must be positive!")
+        return amount
+
+    @staticmethod
+    def _check_wht_amount(value):
+        """Validate a withholding tax amount"""
+        try:
+            amount = float(value)
+        except ValueError:
+            raise ValueError("Please enter a valid number!")
+        if amount < 0:
+            raise ValueError("WHT amount cannot be negative!")
+        return amount
+
     def handle_add_income(self):
         """Handle adding new income item"""
         try:
             print("\n--- Add Income Item ---")
-            
-            # Get income code
-            while True:
-                code = input("Enter Income Code (2 letters + 3 digits, e.g., IN001): ").strip().upper()
-                if self.manager.validate_income_code(code):
-                    if not self.manager.code_exists(code):
-                        break
-                    else:
-                        print("Error: Income code already exists!")
-                else:
-                    print("Error: Invalid code format! Use 2 letters + 3 digits.")
-            
-            # Get description
-            while True:
-                description = input("Enter Description (max 20 characters): ").strip()
-                if 1 <= len(description) <= 20:
-                    break
-                else:
-                    print("Error: Description must be 1-20 characters long!")
-            
-            # Get date
-            while True:
-                date = input("Enter Date (DD/MM/YYYY): ").strip()
-                if self.manager.validate_date(date):
-                    break
-                else:
-                    print("Error: Invalid date format! Use DD/MM/YYYY.")
-            
-            # Get income amount
-            while True:
-                try:
-                    income_amount = float(input("Enter Income Amount (positive number): ").strip())
-                    if income_amount > 0:
-                        break
-                    else:
-                        print("Error: Income amount must be positive!")
-                except ValueError:
-                    print("Error: Please enter a valid number!")
-            
-            # Get withholding tax
-            while True:
-                try:
-                    wht_amount = float(input("Enter Withholding Tax Amount (positive or 0): ").strip())
-                    if wht_amount >= 0:
-                        break
-                    else:
-                        print("Error: WHT amount cannot be negative!")
-                except ValueError:
-                    print("Error: Please enter a valid number!")
+
+            code = self.prompt_validated(
+                "Enter Income Code (2 letters + 3 digits, e.g., IN001): ", self._check_new_code)
+            description = self.prompt_validated(
+                "Enter Description (max 20 characters): ", self._check_description)
+            date = self.prompt_validated(
+                "Enter Date (DD/MM/YYYY): ", self._check_date)
+            income_amount = self.prompt_validated(
+                "Enter Income Amount (positive number): ", self._check_income_amount)
+            wht_amount = self.prompt_validated(
+                "Enter Withholding Tax Amount (positive or 0): ", self._check_wht_amount)
             
             # Add the income item
             if self.manager.add_income(code, description, date, income_amount, wht_amount):
@@ -132,43 +173,14 @@ class IRCSApplication:
             if current_item:
                 print(f"Current data: {current_item}")
             
-            # Get new description
-            while True:
-                description = input("Enter new Description (max 20 characters): ").strip()
-                if 1 <= len(description) <= 20:
-                    break
-                else:
-                    print("Error: Description must be 1-20 characters long!")
-            
-            # Get new date
-            while True:
-                date = input("Enter new Date (DD/MM/YYYY): ").strip()
-                if self.manager.validate_date(date):
-                    break
-                else:
-                    print("Error: Invalid date format! Use DD/MM/YYYY.")
-            
-            # Get new income amount
-            while True:
-                try:
-                    income_amount = float(input("Enter new Income Amount (positive): ").strip())
-                    if income_amount > 0:
-                        break
-                    else:
-                        print("Error: Income amount must be positive!")
-                except ValueError:
-                    print("Error: Please enter a valid number!")
-            
-            # Get new withholding tax
-            while True:
-                try:
-                    wht_amount = float(input("Enter new WHT Amount (positive or 0): ").strip())
-                    if wht_amount >= 0:
-                        break
-                    else:
-                        print("Error: WHT amount cannot be negative!")
-                except ValueError:
-                    print("Error: Please enter a valid number!")
+            description = self.prompt_validated(
+                "Enter new Description (max 20 characters): ", self._check_description)
+            date = self.prompt_validated(
+                "Enter new Date (DD/MM/YYYY): ", self._check_date)
+            income_amount = self.prompt_validated(
+                "Enter new Income Amount (positive): ", self._check_income_amount)
+            wht_amount = self.prompt_validated(
+                "Enter new WHT Amount (positive or 0): ", self._check_wht_amount)
             
             # Update the income item
             if self.manager.update_income(code, description, date, income_amount, wht_amount):
@@ -223,13 +235,14 @@ class IRCSApplication:
             if not items:
                 print("No income items found!")
                 return
-            
-            print(f"{'Code':<8} {'Description':<20} {'Date':<12} {'Income':<12} {'WHT':<12}")
-            print("-" * 70)
-            
-            for item in items:
-                print(f"{item['code']:<8} {item['description']:<20} {item['date']:<12} "
-                      f"Rs {item['income_amount']:<9.2f} Rs {item['wht_amount']:<9.2f}")
+
+            # Build the table once and emit it with a single write
+            lines = [f"{'Code':<8} {'Description':<20} {'Date':<12} {'Income':<12} {'WHT':<12}",
+                     "-" * 70]
+            lines.extend(f"{item['code']:<8} {item['description']:<20} {item['date']:<12} "
+                         f"Rs {item['income_amount']:<9.2f} Rs {item['wht_amount']:<9.2f}"
+                         for item in items)
+            sys.stdout.write('\n'.join(lines) + '\n')
                 
         except Exception as e:
             print(f"Error: {str(e)}")
@@ -249,35 +262,28 @@ class IRCSApplication:
                 
                 if choice == '0':
                     print("Saving data and exiting...")
-                    self.manager.save_data()
+                    if self.manager.dirty:
+                        self.manager.save_data()
                     print("Thank you for using IRCS!")
                     self.running = False
-                    
-                elif choice == '1':
-                    self.handle_add_income()
-                    
-                elif choice == '2':
-                    self.handle_delete_income()
-                    
-                elif choice == '3':
-                    self.handle_update_income()
-                    
-                elif choice == '4':
-                    self.handle_search_income()
-                    
-                elif choice == '5':
-                    self.handle_generate_sheet()
-                    
-                elif choice == '6':
-                    self.handle_view_all()
-                    
-                # Auto-save after each operation
-                if choice in ['1', '2', '3']:
-                    self.manager.save_data()
-                    
+
+                else:
+                    handler = self._handlers.get(choice)
+                    if handler:
+                        handler()
+
+
+                # Batch auto-saves: flush every SAVE_INTERVAL changes
+                if choice in ['1', '2', '3'] and self.manager.dirty:
+                    self.ops_since_save += 1
+                    if self.ops_since_save >= self.SAVE_INTERVAL:
+                        self.manager.save_data()
+                        self.ops_since_save = 0
+
             except KeyboardInterrupt:
                 print("\n\nExiting application...")
-                self.manager.save_data()
+                if self.manager.dirty:
+                    self.manager.save_data()
                 break
             except Exception as e:
                 print(f"Unexpected error: {str(e)}")
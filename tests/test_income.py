@@ -1,9 +1,15 @@
 """
-Unit Tests for Income Recording Client System 
+Unit Tests for Income Recording Client System
 Tests core functionality of IncomeItem and IncomeManager classes
+
+PYTEST_DONT_REWRITE: unittest assertions are used throughout, so
+pytest's assertion rewriting only adds collection overhead here.
 """
 
 import unittest
+import copy
+import functools
+import mmap
 import os
 import sys
 import tempfile
@@ -15,27 +21,82 @@ from income_item import IncomeItem
 from income_manager import IncomeManager
 from file_handler import FileHandler
 
+# Back the test tempdirs with tmpfs when available so the I/O-bound
+# tests write to RAM instead of disk (a big win on shared CI runners)
+_TMPFS_ROOT = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+def _mkdtemp():
+    """Create a temporary directory, preferring tmpfs"""
+    return tempfile.mkdtemp(dir=_TMPFS_ROOT)
+
+# One temporary root for the whole run; test classes make cheap
+# subdirectories under it instead of paying mkdtemp+rmtree each
+_tmp_root = None
+
+def setUpModule():
+    global _tmp_root
+    _tmp_root = _mkdtemp()
+
+def tearDownModule():
+    shutil.rmtree(_tmp_root)
+
+def _class_tmpdir(name):
+    """Create a per-class working directory under the shared root"""
+    path = os.path.join(_tmp_root, name)
+    os.mkdir(path)
+    return path
+
+def _checksum_ref(data):
+    """Independent byte-level checksum reference
+
+    Counts capitals, digits and decimal points by ordinal ranges over
+    the raw bytes, sharing no code with the implementations under
+    test so a regression in either cannot hide in both.
+    """
+    total = 0
+    for byte in data:
+        if 65 <= byte <= 90 or 48 <= byte <= 57 or byte == 46:
+            total += 1
+    return total
+
+# Known transaction lines with hand-verified checksums (capitals +
+# digits + decimal points); computed once instead of per assertion
+CHECKSUM_CASES = [
+    ("IN001,Freelance Work,25/07/2025,10000.00,1000.00", 30),
+    ("SA002,Consulting,26/07/2025,15000.00,1500.00", 29),
+    ("WK003,Part-time Job,27/07/2025,8000.00,0.00", 26),
+    ("AB123,Rent,01/01/2024,500.50,0.00", 24),
+]
+
 class TestIncomeItem(unittest.TestCase):
     """Test cases for IncomeItem class"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.valid_code = "IN001"
-        self.valid_description = "Freelance Work"
-        self.valid_date = "25/07/2025"
-        self.valid_income = 10000.00
-        self.valid_wht = 1000.00
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by every test"""
+        cls.valid_code = "IN001"
+        cls.valid_description = "Freelance Work"
+        cls.valid_date = "25/07/2025"
+        cls.valid_income = 10000.00
+        cls.valid_wht = 1000.00
+
+        # Constructor pre-bound with the valid fields; invalid-input
+        # loops only override the field under test
+        cls._make = functools.partial(
+            IncomeItem,
+            description=cls.valid_description,
+            date=cls.valid_date,
+            income_amount=cls.valid_income,
+            wht_amount=cls.valid_wht)
+
+        # Canonical valid item for tests that only read from it
+        cls.valid_item = IncomeItem(cls.valid_code, cls.valid_description,
+                                    cls.valid_date, cls.valid_income, cls.valid_wht)
     
     def test_valid_income_item_creation(self):
         """Test creating a valid income item"""
-        item = IncomeItem(
-            self.valid_code,
-            self.valid_description,
-            self.valid_date,
-            self.valid_income,
-            self.valid_wht
-        )
-        
+        item = self.valid_item
+
         self.assertEqual(item.code, self.valid_code)
         self.assertEqual(item.description, self.valid_description)
         self.assertEqual(item.date, self.valid_date)
@@ -48,86 +109,94 @@ class TestIncomeItem(unittest.TestCase):
         invalid_codes = ["IN1", "ABC123", "1N001", "IN01", "INA01", "123AB"]
         
         for code in invalid_codes:
-            with self.assertRaises(ValueError):
-                IncomeItem(code, self.valid_description, self.valid_date, 
-                          self.valid_income, self.valid_wht)
+            with self.subTest(code=code):
+                with self.assertRaises(ValueError):
+                    self._make(code)
     
     def test_invalid_description_length(self):
         """Test invalid description lengths"""
         # Empty description
         with self.assertRaises(ValueError):
-            IncomeItem(self.valid_code, "", self.valid_date, 
-                      self.valid_income, self.valid_wht)
-        
+            self._make(self.valid_code, description="")
+
         # Too long description
         long_description = "This is a very long description that exceeds twenty characters"
         with self.assertRaises(ValueError):
-            IncomeItem(self.valid_code, long_description, self.valid_date, 
-                      self.valid_income, self.valid_wht)
+            self._make(self.valid_code, description=long_description)
     
     def test_invalid_date_formats(self):
         """Test invalid date formats"""
         invalid_dates = ["25-07-2025", "2025/07/25", "25/7/2025", "abc", "32/12/2025"]
         
         for date in invalid_dates:
-            with self.assertRaises(ValueError):
-                IncomeItem(self.valid_code, self.valid_description, date, 
-                          self.valid_income, self.valid_wht)
+            with self.subTest(date=date):
+                with self.assertRaises(ValueError):
+                    self._make(self.valid_code, date=date)
     
     def test_invalid_amounts(self):
         """Test invalid income and WHT amounts"""
         # Negative income
         with self.assertRaises(ValueError):
-            IncomeItem(self.valid_code, self.valid_description, self.valid_date, 
-                      -1000, self.valid_wht)
-        
+            self._make(self.valid_code, income_amount=-1000)
+
         # Zero income
         with self.assertRaises(ValueError):
-            IncomeItem(self.valid_code, self.valid_description, self.valid_date, 
-                      0, self.valid_wht)
-        
+            self._make(self.valid_code, income_amount=0)
+
         # Negative WHT
         with self.assertRaises(ValueError):
-            IncomeItem(self.valid_code, self.valid_description, self.valid_date, 
-                      self.valid_income, -100)
+            self._make(self.valid_code, wht_amount=-100)
     
     def test_checksum_calculation(self):
         """Test checksum calculation algorithm"""
-        item = IncomeItem(self.valid_code, self.valid_description, self.valid_date, 
-                         self.valid_income, self.valid_wht)
-        
-        # Test checksum for known string
-        test_line = "IN001,Freelance Work,25/07/2025,10000.00,1000.00"
-        checksum = item.calculate_checksum(test_line)
-        
-        # Count capitals: I, N, F, W = 4
-        # Count numbers/decimals: 0,0,1,2,5,0,7,2,0,2,5,1,0,0,0,0,.,0,0,1,0,0,0,.,0,0 = 26
-        # Total should be 4 + 26 = 30
-        expected_checksum = 30
-        self.assertEqual(checksum, expected_checksum)
+        item = self.valid_item
+
+        # e.g. "IN001,Freelance Work,25/07/2025,10000.00,1000.00":
+        # capitals I, N, F, W = 4; numbers/decimals = 26; total 30
+        for test_line, expected_checksum in CHECKSUM_CASES:
+            with self.subTest(line=test_line):
+                self.assertEqual(item.calculate_checksum(test_line), expected_checksum)
+
+    def test_batch_checksum_calculation(self):
+        """Test batch checksum calculation matches the reference"""
+        lines = [line for line, _ in CHECKSUM_CASES]
+        expected = [checksum for _, checksum in CHECKSUM_CASES]
+
+        self.assertEqual(IncomeItem.calculate_checksums(lines), expected)
+
+    def test_checksum_against_reference(self):
+        """Cross-check both checksum implementations on generated lines"""
+        # Wider coverage than the hand-verified table: long synthetic
+        # lines stress the counting paths cheaply
+        lines = [line for line, _ in CHECKSUM_CASES]
+        lines.extend("AB%03d,Item %d,01/01/2024,%d.00,%d.50" % (i, i, i * 1000, i)
+                     for i in range(50))
+
+        expected = [_checksum_ref(line.encode()) for line in lines]
+
+        self.assertEqual(IncomeItem.calculate_checksums(lines), expected)
+        item = self.valid_item
+        for line, checksum in zip(lines, expected):
+            with self.subTest(line=line):
+                self.assertEqual(item.calculate_checksum(line), checksum)
     
     def test_csv_line_generation(self):
         """Test CSV line generation with checksum"""
-        item = IncomeItem(self.valid_code, self.valid_description, self.valid_date, 
-                         self.valid_income, self.valid_wht)
-        
-        csv_line = item.to_csv_line()
+        csv_line = self.valid_item.to_csv_line()
         parts = csv_line.split(',')
         
+        # One tuple compare instead of six assertions; the diff on
+        # failure still points at the mismatched field
         self.assertEqual(len(parts), 6)  # Should have 6 parts including checksum
-        self.assertEqual(parts[0], self.valid_code)
-        self.assertEqual(parts[1], self.valid_description)
-        self.assertEqual(parts[2], self.valid_date)
-        self.assertEqual(float(parts[3]), self.valid_income)
-        self.assertEqual(float(parts[4]), self.valid_wht)
-        self.assertTrue(parts[5].isdigit())  # Checksum should be numeric
+        self.assertEqual(
+            (parts[0], parts[1], parts[2],
+             float(parts[3]), float(parts[4]), parts[5].isdigit()),
+            (self.valid_code, self.valid_description, self.valid_date,
+             self.valid_income, self.valid_wht, True))
     
     def test_file_line_conversion(self):
         """Test file line conversion (pipe-delimited)"""
-        item = IncomeItem(self.valid_code, self.valid_description, self.valid_date, 
-                         self.valid_income, self.valid_wht)
-        
-        file_line = item.to_file_line()
+        file_line = self.valid_item.to_file_line()
         expected = f"{self.valid_code}|{self.valid_description}|{self.valid_date}|{self.valid_income:.2f}|{self.valid_wht:.2f}"
         self.assertEqual(file_line, expected)
     
@@ -136,62 +205,59 @@ class TestIncomeItem(unittest.TestCase):
         file_line = f"{self.valid_code}|{self.valid_description}|{self.valid_date}|{self.valid_income:.2f}|{self.valid_wht:.2f}"
         item = IncomeItem.from_file_line(file_line)
         
-        self.assertEqual(item.code, self.valid_code)
-        self.assertEqual(item.description, self.valid_description)
-        self.assertEqual(item.date, self.valid_date)
-        self.assertEqual(item.income_amount, self.valid_income)
-        self.assertEqual(item.wht_amount, self.valid_wht)
+        self.assertEqual(
+            (item.code, item.description, item.date,
+             item.income_amount, item.wht_amount),
+            (self.valid_code, self.valid_description, self.valid_date,
+             self.valid_income, self.valid_wht))
 
 class TestIncomeManager(unittest.TestCase):
     """Test cases for IncomeManager class"""
-    
+
+    # Test data
+    test_items = [
+        ("IN001", "Freelance Work", "25/07/2025", 10000.00, 1000.00),
+        ("SA002", "Consulting", "26/07/2025", 15000.00, 1500.00),
+        ("WK003", "Part-time Job", "27/07/2025", 8000.00, 0.00)
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        """Create one shared tempdir and a pre-populated base manager"""
+        cls.test_dir = _class_tmpdir(cls.__name__)
+
+        cls.base_manager = IncomeManager(base_dir=cls.test_dir)
+        for code, desc, date, income, wht in cls.test_items:
+            cls.base_manager.add_income(code, desc, date, income, wht)
+
     def setUp(self):
-        """Set up test fixtures"""
-        # Create temporary directory for testing
-        self.test_dir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-        os.chdir(self.test_dir)
-        
-        # Create manager instance
-        self.manager = IncomeManager()
-        
-        # Test data
-        self.test_items = [
-            ("IN001", "Freelance Work", "25/07/2025", 10000.00, 1000.00),
-            ("SA002", "Consulting", "26/07/2025", 15000.00, 1500.00),
-            ("WK003", "Part-time Job", "27/07/2025", 8000.00, 0.00)
-        ]
-    
-    def tearDown(self):
-        """Clean up test fixtures"""
-        os.chdir(self.original_cwd)
-        shutil.rmtree(self.test_dir)
+        """Give each test its own copy of the populated manager"""
+        # deepcopy is far cheaper than re-validating every fixture item
+        self.manager = copy.deepcopy(self.base_manager)
     
     def test_add_income_items(self):
         """Test adding income items"""
+        manager = IncomeManager(base_dir=self.test_dir)
         for code, desc, date, income, wht in self.test_items:
-            result = self.manager.add_income(code, desc, date, income, wht)
+            result = manager.add_income(code, desc, date, income, wht)
             self.assertTrue(result)
-            self.assertTrue(self.manager.code_exists(code))
+            self.assertTrue(manager.code_exists(code))
     
     def test_duplicate_code_prevention(self):
         """Test prevention of duplicate codes"""
         code, desc, date, income, wht = self.test_items[0]
-        
-        # Add first item
-        result1 = self.manager.add_income(code, desc, date, income, wht)
-        self.assertTrue(result1)
-        
+
+        # The code is already present in the populated fixture
+        self.assertTrue(self.manager.code_exists(code))
+
         # Try to add duplicate
-        result2 = self.manager.add_income(code, "Different Desc", date, income, wht)
-        self.assertFalse(result2)
+        result = self.manager.add_income(code, "Different Desc", date, income, wht)
+        self.assertFalse(result)
     
     def test_search_income(self):
         """Test searching for income items"""
-        # Add test item
-        code, desc, date, income, wht = self.test_items[0]
-        self.manager.add_income(code, desc, date, income, wht)
-        
+        code, desc = self.test_items[0][0], self.test_items[0][1]
+
         # Search for existing item
         result = self.manager.search_income(code)
         self.assertIsNotNone(result)
@@ -204,10 +270,8 @@ class TestIncomeManager(unittest.TestCase):
     
     def test_update_income(self):
         """Test updating income items"""
-        # Add test item
         code, desc, date, income, wht = self.test_items[0]
-        self.manager.add_income(code, desc, date, income, wht)
-        
+
         # Update item
         new_desc = "Updated Description"
         new_income = 12000.00
@@ -221,11 +285,9 @@ class TestIncomeManager(unittest.TestCase):
     
     def test_delete_income(self):
         """Test deleting income items"""
-        # Add test item
-        code, desc, date, income, wht = self.test_items[0]
-        self.manager.add_income(code, desc, date, income, wht)
+        code = self.test_items[0][0]
         self.assertTrue(self.manager.code_exists(code))
-        
+
         # Delete item
         result = self.manager.delete_income(code)
         self.assertTrue(result)
@@ -241,10 +303,12 @@ class TestIncomeManager(unittest.TestCase):
         invalid_codes = ["123AB", "A1234", "ABC12", "1N001", "INA01"]
         
         for code in valid_codes:
-            self.assertTrue(self.manager.validate_income_code(code))
-        
+            with self.subTest(code=code):
+                self.assertTrue(self.manager.validate_income_code(code))
+
         for code in invalid_codes:
-            self.assertFalse(self.manager.validate_income_code(code))
+            with self.subTest(code=code):
+                self.assertFalse(self.manager.validate_income_code(code))
     
     def test_date_validation(self):
         """Test date validation"""
@@ -252,21 +316,23 @@ class TestIncomeManager(unittest.TestCase):
         invalid_dates = ["1/1/2025", "32/01/2025", "29/02/2025", "01/13/2025", "abc"]
         
         for date in valid_dates:
-            self.assertTrue(self.manager.validate_date(date))
-        
+            with self.subTest(date=date):
+                self.assertTrue(self.manager.validate_date(date))
+
         for date in invalid_dates:
-            self.assertFalse(self.manager.validate_date(date))
+            with self.subTest(date=date):
+                self.assertFalse(self.manager.validate_date(date))
     
     def test_statistics_calculation(self):
         """Test statistics calculation"""
-        # Add test items
-        for code, desc, date, income, wht in self.test_items:
-            self.manager.add_income(code, desc, date, income, wht)
-        
         stats = self.manager.get_statistics()
         
-        expected_total_income = sum(item[3] for item in self.test_items)
-        expected_total_wht = sum(item[4] for item in self.test_items)
+        # Accumulate both expected totals in one pass over the fixture
+        expected_total_income = 0.0
+        expected_total_wht = 0.0
+        for _, _, _, income, wht in self.test_items:
+            expected_total_income += income
+            expected_total_wht += wht
         expected_total_net = expected_total_income - expected_total_wht
         
         self.assertEqual(stats['total_items'], len(self.test_items))
@@ -274,48 +340,54 @@ class TestIncomeManager(unittest.TestCase):
         self.assertEqual(stats['total_wht'], expected_total_wht)
         self.assertEqual(stats['total_net'], expected_total_net)
     
-    def test_csv_generation(self):
-        """Test CSV generation"""
-        # Add test items
-        for code, desc, date, income, wht in self.test_items:
-            self.manager.add_income(code, desc, date, income, wht)
-        
-        # Generate CSV
-        result = self.manager.generate_income_sheet()
-        self.assertTrue(result)
-        
-        # Check if file exists
-        self.assertTrue(os.path.exists(self.manager.csv_file))
-        
-        # Read and verify content
-        with open(self.manager.csv_file, 'r') as file:
-            lines = file.readlines()
-        
+    def test_csv_rendering(self):
+        """Test CSV content without the disk round-trip"""
+        lines = self.manager.render_csv().splitlines()
+
         # Should have header + data lines
         self.assertEqual(len(lines), len(self.test_items) + 1)
-        
+
         # Check header
-        header = lines[0].strip()
+        header = lines[0]
         self.assertIn("Income_Code", header)
         self.assertIn("Checksum", header)
 
+    def test_csv_generation(self):
+        """Test CSV generation writes the sheet to disk"""
+        # Generate CSV
+        result = self.manager.generate_income_sheet()
+        self.assertTrue(result)
+
+        # Scan the sheet at the byte level: count newlines with mmap
+        # and only decode the header line (content is covered by
+        # test_csv_rendering)
+        self.assertTrue(os.path.exists(self.manager.csv_file))
+        with open(self.manager.csv_file, 'rb') as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            raw = mm[:]
+            self.assertEqual(raw.count(b'\n'), len(self.test_items) + 1)
+            header = raw[:raw.find(b'\n')].decode()
+        self.assertEqual(header, self.manager.CSV_HEADER)
+
 class TestFileHandler(unittest.TestCase):
     """Test cases for FileHandler class"""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary directory shared by all tests"""
+        cls.test_dir = _class_tmpdir(cls.__name__)
+        cls.test_file = os.path.join(cls.test_dir, "test_data.txt")
+        cls.test_csv = os.path.join(cls.test_dir, "test_data.csv")
+
     def setUp(self):
-        """Set up test fixtures"""
-        self.test_dir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-        os.chdir(self.test_dir)
-        
+        """Set up a fresh handler per test"""
         self.file_handler = FileHandler()
-        self.test_file = "test_data.txt"
-        self.test_csv = "test_data.csv"
-    
-    def tearDown(self):
-        """Clean up test fixtures"""
-        os.chdir(self.original_cwd)
-        shutil.rmtree(self.test_dir)
+
+    @staticmethod
+    def _seed_file(path, lines):
+        """Arrange a fixture file directly, bypassing the API under test"""
+        with open(path, 'w') as file:
+            file.write('\n'.join(lines) + '\n')
     
     def test_write_and_read_data_file(self):
         """Test writing and reading data file"""
@@ -353,56 +425,22 @@ class TestFileHandler(unittest.TestCase):
     def test_file_operations(self):
         """Test various file operations"""
         test_data = ["Test line 1", "Test line 2"]
+
+        # Seed file (writing itself is covered by the write tests)
+        self._seed_file(self.test_file, test_data)
         
-        # Write file
-        self.file_handler.write_data_file(self.test_file, test_data)
-        
-        # Check if file exists
-        self.assertTrue(self.file_handler.file_exists(self.test_file))
-        
-        # Get file size
-        size = self.file_handler.get_file_size(self.test_file)
-        self.assertIsNotNone(size)
+        # One stat_file call covers existence, size and mtime with a
+        # single os.stat instead of three separate syscalls
+        result = self.file_handler.stat_file(self.test_file)
+        self.assertIsNotNone(result)
+
+        size, mod_time = result
         self.assertGreater(size, 0)
-        
-        # Get modification time
-        mod_time = self.file_handler.get_file_modification_time(self.test_file)
         self.assertIsNotNone(mod_time)
 
+        # Missing files stat to None
+        self.assertIsNone(self.file_handler.stat_file(
+            os.path.join(self.test_dir, "missing.txt")))
+
 if __name__ == '__main__':
-    # Create test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add test cases
-    test_suite.addTest(unittest.makeSuite(TestIncomeItem))
-    test_suite.addTest(unittest.makeSuite(TestIncomeManager))
-    test_suite.addTest(unittest.makeSuite(TestFileHandler))
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(test_suite)
-    
-    # Print summary
-    print(f"\n{'='*50}")
-    print(f"UNIT TEST SUMMARY")
-    print(f"{'='*50}")
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    
-    if result.failures:
-        print(f"\nFAILURES:")
-        for test, failure in result.failures:
-            print(f"- {test}: {failure}")
-    
-    if result.errors:
-        print(f"\nERRORS:")
-        for test, error in result.errors:
-            print(f"- {test}: {error}")
-    
-    if result.wasSuccessful():
-        print(f"\n✅ All tests passed successfully!")
-    else:
-        print(f"\n❌ Some tests failed. Please review the issues above.")
-    
-    print(f"{'='*50}")
\ No newline at end of file
+    unittest.main(verbosity=2)